@@ -0,0 +1,57 @@
+# src/cache.py
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+import pandas as pd
+
+from .utils import CACHE_DIR
+
+log = logging.getLogger(__name__)
+
+
+class FileCache:
+    """
+    On-disk DataFrame cache: one parquet file per key, expired by file age.
+    """
+
+    def __init__(self, root: Path = CACHE_DIR):
+        self.root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.parquet"
+
+    def get(self, key: str, ttl: float):
+        """
+        Return the cached DataFrame for key, or None if missing or older than ttl seconds.
+        Expired entries are deleted.
+        """
+        p = self._path(key)
+        try:
+            if not p.exists():
+                return None
+            if time.time() - p.stat().st_mtime > ttl:
+                p.unlink(missing_ok=True)
+                return None
+            return pd.read_parquet(p)
+        except Exception as e:
+            log.warning(f"Ignoring unreadable cache entry {p}: {e}")
+            return None
+
+    def set(self, key: str, df: pd.DataFrame):
+        """
+        Store a DataFrame under key. Empty frames are not cached.
+        """
+        if df is None or df.empty:
+            return
+        p = self._path(key)
+        tmp = p.with_name(f"{p.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp)
+            # Atomic rename so concurrent readers never see a partial file
+            os.replace(tmp, p)
+        except Exception as e:
+            log.warning(f"Could not write cache entry {p}: {e}")
+            tmp.unlink(missing_ok=True)
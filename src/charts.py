@@ -1,4 +1,6 @@
 from pathlib import Path
+import matplotlib
+matplotlib.use("Agg")  # file output only; skip GUI backend probing
 import matplotlib.pyplot as plt
 import mplfinance as mpf
 import pandas as pd
@@ -8,18 +10,31 @@ from .utils import CHART_DIR
 # Ensure charts directory exists
 CHART_DIR.mkdir(parents=True, exist_ok=True)
 
+# One figure reused by line/bar charts; building a fresh figure per chart dominates render time.
+# Created on first use so processes that never draw one don't pay for it.
+_FIG = _AX = None
+
+
+def _figure():
+    """Return the shared (Figure, Axes), cleared for a new chart."""
+    global _FIG, _AX
+    if _FIG is None:
+        _FIG, _AX = plt.subplots()
+    _AX.clear()
+    return _FIG, _AX
+
+
 def line_chart(series: pd.Series, title: str, filename: str):
     """Create and save a line chart from a Series."""
     p = CHART_DIR / filename
-    plt.figure()
-    plt.plot(series.index, series.values, color="blue")
-    plt.title(title)
-    plt.xlabel("Date")
-    plt.ylabel("Value")
-    plt.grid(True, linestyle="--", alpha=0.6)
-    plt.tight_layout()
-    plt.savefig(p)
-    plt.close()
+    fig, ax = _figure()
+    ax.plot(series.index, series.values, color="blue")
+    ax.set_title(title)
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Value")
+    ax.grid(True, linestyle="--", alpha=0.6)
+    fig.tight_layout()
+    fig.savefig(p)
     return str(p)
 
 def candlestick_chart(df: pd.DataFrame, title: str, filename: str):
@@ -27,22 +42,22 @@ def candlestick_chart(df: pd.DataFrame, title: str, filename: str):
     p = CHART_DIR / filename
     if not {"Open", "High", "Low", "Close"}.issubset(df.columns):
         raise ValueError("DataFrame must contain Open, High, Low, Close columns for candlestick chart")
-    dfc = df.copy()
-    dfc.index.name = "Date"
+    # Shallow copy: only the index label changes, the OHLC buffers are shared
+    dfc = df.copy(deep=False)
+    dfc.index = df.index.rename("Date")
     mpf.plot(dfc, type="candle", title=title, savefig=str(p), style="yahoo")
     return str(p)
 
 def bar_chart(df: pd.DataFrame, xcol: str, ycol: str, title: str, filename: str):
     """Create and save a bar chart from a DataFrame column."""
     p = CHART_DIR / filename
-    plt.figure()
-    plt.bar(df[xcol].astype(str), df[ycol].astype(float), color="green")
-    plt.title(title)
-    plt.xlabel(xcol)
-    plt.ylabel(ycol)
-    plt.xticks(rotation=45, ha="right")
-    plt.grid(axis="y", linestyle="--", alpha=0.6)
-    plt.tight_layout()
-    plt.savefig(p)
-    plt.close()
+    fig, ax = _figure()
+    ax.bar(df[xcol].astype(str), df[ycol].astype(float), color="green")
+    ax.set_title(title)
+    ax.set_xlabel(xcol)
+    ax.set_ylabel(ycol)
+    plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
+    ax.grid(axis="y", linestyle="--", alpha=0.6)
+    fig.tight_layout()
+    fig.savefig(p)
     return str(p)
@@ -1,12 +1,21 @@
 # src/fetchers.py
+import hashlib
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 import yfinance as yf
-import requests
 import logging
+import orjson
+from curl_cffi import requests as curl_requests
+
+from .cache import FileCache
 
 log = logging.getLogger(__name__)
 
+NEWS_URL = "https://newsapi.org/v2/top-headlines"
+
 # --- Static Tickers ---
 INDEX_TICKERS = {
     "NIFTY 50": "^NSEI",
@@ -41,14 +50,35 @@ CRYPTO_TICKERS = {
     "Ethereum": "ETH-USD",
 }
 
+# Worker threads for per-symbol fetches (I/O bound)
+MAX_WORKERS = 16
+
+# Cache TTLs (seconds). Every price window ends with the current, still-open
+# bar (crypto never closes), so price entries must stay short-lived.
+PRICE_TTL = 15 * 60
+CONSTITUENTS_TTL = 24 * 60 * 60
+
+_CACHE = FileCache()
+
+# Shared keep-alive session for all Yahoo calls (yfinance requires curl_cffi sessions)
+_SESSION = curl_requests.Session(impersonate="chrome")
+
+# yf.download keeps results in module-level state, so concurrent calls must not overlap
+_DOWNLOAD_LOCK = threading.Lock()
+
 # --- Helpers ---
 def _pct(a, b):
-    try:
-        if b == 0 or b is None:
-            return None
-        return (a - b) / b * 100.0
-    except Exception:
-        return None
+    return (a - b) / b * 100.0 if b else None
+
+
+def _pct_array(last, prev):
+    """
+    Vectorized _pct: percent change per element, NaN where prev is 0 or missing.
+    """
+    last = np.asarray(last, dtype=np.float64)
+    prev = np.asarray(prev, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(prev != 0, (last - prev) / prev * 100.0, np.nan)
 
 
 def _flatten_df(df: pd.DataFrame) -> pd.DataFrame:
@@ -60,27 +90,142 @@ def _flatten_df(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _cache_key(*parts) -> str:
+    raw = "|".join(str(p) for p in parts)
+    return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+
+def _cached_download(symbols, period="2d", interval="1d", **kwargs):
+    """
+    yf.download with an on-disk cache keyed by (symbols, period, interval).
+    """
+    if not isinstance(symbols, str):
+        symbols = " ".join(symbols)
+    key = _cache_key("download", symbols, period, interval, sorted(kwargs.items()))
+    df = _CACHE.get(key, PRICE_TTL)
+    if df is not None:
+        return df
+
+    with _DOWNLOAD_LOCK:
+        df = yf.download(
+            symbols, period=period, interval=interval,
+            progress=False, auto_adjust=False, session=_SESSION, **kwargs
+        )
+    _CACHE.set(key, df)
+    return df
+
+
+def _cached_history(symbol: str, period="2d", interval="1d"):
+    """
+    Ticker.history with the same on-disk cache as _cached_download.
+    """
+    key = _cache_key("history", symbol, period, interval)
+    df = _CACHE.get(key, PRICE_TTL)
+    if df is not None:
+        return df
+
+    df = yf.Ticker(symbol, session=_SESSION).history(period=period, interval=interval, auto_adjust=False)
+    _CACHE.set(key, df)
+    return df
+
+
+def _download_batch(symbols, period="2d", interval="1d"):
+    """
+    Download several symbols in one call; columns are grouped by ticker.
+    """
+    try:
+        return _cached_download(
+            list(symbols), period=period, interval=interval,
+            group_by="ticker", threads=True
+        )
+    except Exception as e:
+        log.error(f"Error in batch download: {e}")
+        return pd.DataFrame()
+
+
+def _batch_slice(batch: pd.DataFrame, symbol: str) -> pd.DataFrame:
+    """
+    Slice one symbol out of a batched download (empty if the batch has no data for it).
+    """
+    try:
+        # Batched frames share one date index across markets; drop the gaps
+        return batch[symbol].dropna(how="all")
+    except KeyError:
+        return pd.DataFrame()
+
+
+def _history_frame(symbol: str, period="2d", interval="1d") -> pd.DataFrame:
+    """
+    Single-symbol fetch for tickers missing from a batch.
+    Ticker.history, unlike yf.download, is safe to call from worker threads.
+    """
+    try:
+        df = _cached_history(symbol, period=period, interval=interval)
+        if df is None:
+            return pd.DataFrame()
+        return _flatten_df(df).dropna(how="all")
+    except Exception as e:
+        log.error(f"Error fetching {symbol}: {e}")
+        return pd.DataFrame()
+
+
+def _ticker_frame(batch: pd.DataFrame, symbol: str, period="2d", interval="1d"):
+    """
+    Slice one symbol out of a batched download.
+    Falls back to a single-symbol download if the batch has no data for the ticker.
+    """
+    df = _batch_slice(batch, symbol)
+    if not df.empty:
+        return df
+    # Failed tickers come back as all-NaN columns; retry them on their own
+    return _history_frame(symbol, period=period, interval=interval)
+
+
+def _last_prev(df: pd.DataFrame):
+    """
+    Returns (last close, previous close); both None if unavailable.
+    """
+    if df.empty or "Close" not in df.columns:
+        return None, None
+    closes = df["Close"].to_numpy(dtype=np.float64)
+    last = float(closes[-1])
+    prev = float(closes[-2]) if closes.size > 1 else last
+    return last, prev
+
+
+def _fetch_closes(symbols: list):
+    """
+    Returns list of (sym, last, prev) for each symbol.
+    Symbols are sliced from one batched download; only those missing from it
+    are re-fetched, concurrently.
+    """
+    batch = _download_batch(symbols)
+    frames = {sym: _batch_slice(batch, sym) for sym in symbols}
+
+    missing = [sym for sym, df in frames.items() if df.empty]
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(missing))) as ex:
+            frames.update(zip(missing, ex.map(_history_frame, missing)))
+
+    return [(sym, *_last_prev(frames[sym])) for sym in symbols]
+
+
 def get_snapshots(tickers: dict):
     """
     Returns dict: name -> {Open, Close, Change%, LTP}
     """
     data = {}
+    batch = _download_batch(tickers.values())
     for name, symbol in tickers.items():
         try:
-            df = yf.download(
-                symbol, period="2d", interval="1d",
-                progress=False, threads=False, auto_adjust=False
-            )
+            df = _ticker_frame(batch, symbol)
             if df is None or df.empty:
                 continue
 
-            df = _flatten_df(df)
-            last_row = df.iloc[-1]
-            prev_row = df.iloc[-2] if len(df) > 1 else last_row
-
-            open_price = float(last_row["Open"])
-            close_price = float(last_row["Close"])
-            prev_close = float(prev_row["Close"])
+            # Plain ndarray indexing; .iloc/label lookups dominate on 2-row frames
+            arr = df[["Open", "Close"]].to_numpy(dtype=np.float64)
+            open_price, close_price = arr[-1].tolist()
+            prev_close = float(arr[-2, 1]) if arr.shape[0] > 1 else close_price
 
             data[name] = {
                 "Open": open_price,
@@ -96,12 +241,11 @@ def get_snapshots(tickers: dict):
 def get_index_history(symbol: str, period="6mo", interval="1d"):
     """
     Returns a DataFrame with columns Open, High, Low, Close (or empty DataFrame).
+    The frame is not copied; callers should treat it as read-only.
     """
     try:
-        df = yf.download(
-            symbol, period=period, interval=interval,
-            progress=False, threads=False, auto_adjust=False
-        )
+        # Ticker.history bypasses the yf.download lock, so histories fetch in parallel
+        df = _cached_history(symbol, period=period, interval=interval)
         if df is None or df.empty:
             return pd.DataFrame()
 
@@ -109,89 +253,88 @@ def get_index_history(symbol: str, period="6mo", interval="1d"):
 
         expected = ["Open", "High", "Low", "Close"]
         if all(col in df.columns for col in expected):
-            return df[expected].copy()
-        return df.copy()
+            return df[expected]
+        return df
     except Exception as e:
         log.error(f"Error fetching history for {symbol}: {e}")
         return pd.DataFrame()
 
 
 def get_nifty50_constituents():
+    """
+    Returns the NIFTY 50 constituents list, cached on disk for a day
+    (the index is only reconstituted periodically).
+    """
     url = "https://archives.nseindia.com/content/indices/ind_nifty50list.csv"
+    df = _CACHE.get("nifty50_constituents", CONSTITUENTS_TTL)
+    if df is not None:
+        return df
     try:
         df = pd.read_csv(url)
         if "Symbol" in df.columns:
-            df["YahooSymbol"] = df["Symbol"].astype(str).apply(lambda s: f"{s}.NS")
+            df["YahooSymbol"] = df["Symbol"].astype(str) + ".NS"
+        _CACHE.set("nifty50_constituents", df)
         return df
     except Exception as e:
         log.error(f"Error fetching NIFTY 50 constituents: {e}")
         return pd.DataFrame(columns=["Symbol", "YahooSymbol", "Sector"])
 
 
-def top_movers_from_universe(universe, n=5):
-    gainers, losers = pd.DataFrame(), pd.DataFrame()
+def universe_prices(universe):
+    """
+    Fetch closes for every universe member once.
+    Returns DataFrame [YahooSymbol, Symbol, Close, Close_prev, Change%]; Change% is NaN where undefined.
+    """
+    cols = ["YahooSymbol", "Symbol", "Close", "Close_prev", "Change%"]
+    if "YahooSymbol" not in universe.columns:
+        return pd.DataFrame(columns=cols)
     try:
-        rows = []
-        for _, row in universe.iterrows():
-            sym = str(row.get("YahooSymbol", ""))
-            base = str(row.get("Symbol", sym))
-            if not sym:
-                continue
+        universe = universe[universe["YahooSymbol"].astype(str) != ""]
+        symbols = universe["YahooSymbol"].astype(str).tolist()
+
+        prices = pd.DataFrame(_fetch_closes(symbols), columns=["YahooSymbol", "Close", "Close_prev"])
+        prices["Symbol"] = universe.get("Symbol", universe["YahooSymbol"]).astype(str).tolist()
+        prices = prices.dropna(subset=["Close"])
+        prices["Change%"] = _pct_array(prices["Close"], prices["Close_prev"])
+        return prices[cols]
+    except Exception as e:
+        log.error(f"Error fetching universe prices: {e}")
+        return pd.DataFrame(columns=cols)
 
-            df = yf.download(
-                sym, period="2d", interval="1d",
-                progress=False, threads=False, auto_adjust=False
-            )
-            if df is None or df.empty:
-                continue
 
-            df = _flatten_df(df)
-            last = float(df.iloc[-1]["Close"])
-            prev = float(df.iloc[-2]["Close"]) if len(df) > 1 else last
-            change_pct = _pct(last, prev) or 0.0
-            rows.append({"Symbol": base, "Close": last, "Change%": change_pct})
+def top_movers_from_universe(universe, n=5, prices=None):
+    """
+    Returns (gainers, losers) DataFrames [Symbol, Close, Change%].
+    Pass prices from universe_prices() to reuse an earlier fetch.
+    """
+    gainers, losers = pd.DataFrame(), pd.DataFrame()
+    try:
+        if prices is None:
+            prices = universe_prices(universe)
 
-        dfm = pd.DataFrame(rows)
+        dfm = prices[["Symbol", "Close", "Change%"]].astype({"Close": float, "Change%": float})
+        dfm["Change%"] = dfm["Change%"].fillna(0.0)
         if not dfm.empty:
-            dfm_sorted = dfm.sort_values(by="Change%", ascending=False)
-            gainers = dfm_sorted.head(n).reset_index(drop=True)
-            losers = dfm_sorted.sort_values(by="Change%", ascending=True).head(n).reset_index(drop=True)
+            gainers = dfm.nlargest(n, "Change%").reset_index(drop=True)
+            losers = dfm.nsmallest(n, "Change%").reset_index(drop=True)
     except Exception as e:
         log.error(f"Error fetching movers: {e}")
     return gainers, losers
 
 
-def sector_performance(universe):
+def sector_performance(universe, prices=None):
+    """
+    Returns DataFrame [Sector, Change%] of average change per sector.
+    Pass prices from universe_prices() to reuse an earlier fetch.
+    """
     try:
-        if "Sector" not in universe.columns:
+        if "Sector" not in universe.columns or "YahooSymbol" not in universe.columns:
             return pd.DataFrame()
+        if prices is None:
+            prices = universe_prices(universe)
 
-        perf = []
-        for sector, group in universe.groupby("Sector"):
-            changes = []
-            for _, row in group.iterrows():
-                sym = str(row.get("YahooSymbol", ""))
-                if not sym:
-                    continue
-
-                df = yf.download(
-                    sym, period="2d", interval="1d",
-                    progress=False, threads=False, auto_adjust=False
-                )
-                if df is None or df.empty:
-                    continue
-
-                df = _flatten_df(df)
-                last = float(df.iloc[-1]["Close"])
-                prev = float(df.iloc[-2]["Close"]) if len(df) > 1 else last
-                ch = _pct(last, prev)
-                if ch is not None:
-                    changes.append(ch)
-
-            if changes:
-                perf.append({"Sector": sector, "Change%": sum(changes) / len(changes)})
-
-        return pd.DataFrame(perf)
+        merged = prices[["YahooSymbol", "Change%"]].merge(universe[["YahooSymbol", "Sector"]], on="YahooSymbol")
+        return merged.groupby("Sector")["Change%"].mean().dropna().reset_index()
     except Exception as e:
         log.error(f"Error fetching sector performance: {e}")
         return pd.DataFrame()
@@ -211,10 +354,10 @@ def news_top_headlines_india(api_key=""):
     if not api_key:
         return []
     try:
-        url = f"https://newsapi.org/v2/top-headlines?country=in&category=business&pageSize=10&apiKey={api_key}"
-        r = requests.get(url, timeout=15)
+        params = {"country": "in", "category": "business", "pageSize": 10, "apiKey": api_key}
+        r = _SESSION.get(NEWS_URL, params=params, timeout=15)
         r.raise_for_status()
-        articles = r.json().get("articles", [])
+        articles = orjson.loads(r.content).get("articles", [])
         return [
             {
                 "title": a.get("title", ""),
@@ -1,11 +1,16 @@
+import asyncio
 import logging
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import pandas as pd
 
-from .utils import ensure_dirs, save_csv, save_json, load_config
+from .utils import ensure_dirs, save_parquet, save_json, load_config
 from .fetchers import (
     INDEX_TICKERS, CURRENCY_TICKERS, COMMODITY_TICKERS, CRYPTO_TICKERS,
-    get_snapshots, get_index_history, get_nifty50_constituents,
+    get_snapshots, get_index_history, get_nifty50_constituents, universe_prices,
     top_movers_from_universe, sector_performance, fii_dii_cash, news_top_headlines_india
 )
 from .charts import line_chart, candlestick_chart, bar_chart
@@ -21,20 +26,85 @@ logging.basicConfig(
 )
 
 
+SUMMARY_INDEX_NAMES = ["NIFTY 50", "NIFTY BANK", "SENSEX", "S&P 500", "DOW JONES", "NASDAQ"]
+OTHER_GLOBAL_INDEX_NAMES = ["FTSE 100", "DAX", "NIKKEI 225", "HANG SENG", "SHANGHAI COMP"]
+
+# Every snapshot symbol, fetched as one batched download
+SNAPSHOT_TICKERS = {
+    **{k: INDEX_TICKERS[k] for k in SUMMARY_INDEX_NAMES + OTHER_GLOBAL_INDEX_NAMES},
+    **CURRENCY_TICKERS,
+    **COMMODITY_TICKERS,
+    **CRYPTO_TICKERS,
+}
+
+CHART_RENDERERS = {
+    "line": line_chart,
+    "candle": candlestick_chart,
+    "bar": bar_chart,
+}
+
+
+# Below this many charts, process start-up costs more than it saves
+MIN_PARALLEL_CHARTS = 4
+
+
+def _render_one(spec):
+    """Render one (kind, args) chart spec."""
+    kind, args = spec
+    return CHART_RENDERERS[kind](*args)
+
+
+def _render_charts(chart_specs):
+    """
+    Render (title, kind, args) specs; returns {title: path} in spec order.
+
+    Uses a fork-based process pool where available (workers inherit the
+    already-imported modules). Spawn-only platforms and macOS, where fork is
+    unsafe, render serially: re-importing the app in every worker costs
+    more than rendering a few charts.
+    """
+    jobs = [(kind, args) for _, kind, args in chart_specs]
+    can_fork = "fork" in multiprocessing.get_all_start_methods() and sys.platform != "darwin"
+    if can_fork and len(jobs) >= MIN_PARALLEL_CHARTS:
+        workers = min(len(jobs), os.cpu_count() or 1)
+        ctx = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as ex:
+            paths = list(ex.map(_render_one, jobs))
+    else:
+        paths = [_render_one(job) for job in jobs]
+    return {title: path for (title, _, _), path in zip(chart_specs, paths)}
+
+
+def _fmt(x, suffix=""):
+    return f"{x:.2f}{suffix}" if x else "-"
+
+
 def dict_to_rows(dct, first_col="Name"):
     """Convert dict data into a list of rows for PDF tables."""
     rows = [[first_col, "Open", "Close", "Change %", "LTP"]]
-    for k, v in dct.items():
-        rows.append([
-            k,
-            f"{v.get('Open', 0):.2f}" if v.get("Open") else "-",
-            f"{v.get('Close', 0):.2f}" if v.get("Close") else "-",
-            f"{v.get('Change%', 0):.2f}%" if v.get("Change%") else "-",
-            f"{v.get('LTP', 0):.2f}" if v.get("LTP") else "-"
-        ])
+    rows.extend(
+        [k, _fmt(v.get("Open")), _fmt(v.get("Close")), _fmt(v.get("Change%"), "%"), _fmt(v.get("LTP"))]
+        for k, v in dct.items()
+    )
     return rows
 
 
+def _pick(data: dict, names):
+    """Subset of data for the given names, in that order."""
+    return {k: data[k] for k in names if k in data}
+
+
+async def _fetch_all(cfg):
+    """Run the independent network fetches concurrently (each in a worker thread)."""
+    return await asyncio.gather(
+        asyncio.to_thread(get_snapshots, SNAPSHOT_TICKERS),
+        asyncio.to_thread(get_index_history, INDEX_TICKERS["NIFTY 50"], period="3mo", interval="1d"),
+        asyncio.to_thread(get_index_history, INDEX_TICKERS["NIFTY BANK"], period="3mo", interval="1d"),
+        asyncio.to_thread(get_nifty50_constituents),
+        asyncio.to_thread(news_top_headlines_india, api_key=cfg.get("news_api_key", "")),
+    )
+
+
 def build():
     try:
         logging.info("Ensuring directories...")
@@ -43,64 +113,47 @@ def build():
         logging.info("Loading configuration...")
         cfg = load_config()
 
-        # 1) Snapshots
-        logging.info("Fetching market snapshots...")
-        summary_indices = get_snapshots({
-            "NIFTY 50": INDEX_TICKERS["NIFTY 50"],
-            "NIFTY BANK": INDEX_TICKERS["NIFTY BANK"],
-            "SENSEX": INDEX_TICKERS["SENSEX"],
-            "S&P 500": INDEX_TICKERS["S&P 500"],
-            "DOW JONES": INDEX_TICKERS["DOW JONES"],
-            "NASDAQ": INDEX_TICKERS["NASDAQ"],
-        })
-
-        indian_indices = {k: v for k, v in summary_indices.items() if k in ["NIFTY 50", "NIFTY BANK", "SENSEX"]}
-        global_indices = {k: v for k, v in summary_indices.items() if k in ["S&P 500", "DOW JONES", "NASDAQ"]}
-        global_indices.update(get_snapshots({
-            k: v for k, v in INDEX_TICKERS.items()
-            if k in ["FTSE 100", "DAX", "NIKKEI 225", "HANG SENG", "SHANGHAI COMP"]
-        }))
-
-        currencies = get_snapshots(CURRENCY_TICKERS)
-        commodities = get_snapshots(COMMODITY_TICKERS)
-        crypto = get_snapshots(CRYPTO_TICKERS)
-
-        # 2) Histories
-        logging.info("Fetching historical data...")
-        hist_nifty = get_index_history(INDEX_TICKERS["NIFTY 50"], period="3mo", interval="1d")
-        hist_bank = get_index_history(INDEX_TICKERS["NIFTY BANK"], period="3mo", interval="1d")
-
-        # 3) Universe
-        logging.info("Fetching NIFTY50 universe...")
-        universe = get_nifty50_constituents()
-        gainers, losers = top_movers_from_universe(universe, n=5)
-        sector_perf = sector_performance(universe)
-
-        # 4) Other blocks
+        # 1) Network fetches (independent, run concurrently)
+        logging.info("Fetching snapshots, histories, NIFTY50 universe and news...")
+        snapshots, hist_nifty, hist_bank, universe, news = asyncio.run(_fetch_all(cfg))
+
+        summary_indices = _pick(snapshots, SUMMARY_INDEX_NAMES)
+        indian_indices = _pick(snapshots, ["NIFTY 50", "NIFTY BANK", "SENSEX"])
+        global_indices = _pick(snapshots, ["S&P 500", "DOW JONES", "NASDAQ"] + OTHER_GLOBAL_INDEX_NAMES)
+        currencies = _pick(snapshots, CURRENCY_TICKERS)
+        commodities = _pick(snapshots, COMMODITY_TICKERS)
+        crypto = _pick(snapshots, CRYPTO_TICKERS)
+
+        # 2) Universe analytics
+        logging.info("Computing movers and sector performance...")
+        prices = universe_prices(universe)
+        gainers, losers = top_movers_from_universe(universe, n=5, prices=prices)
+        sector_perf = sector_performance(universe, prices=prices)
+
+        # 3) Other blocks
         fii = fii_dii_cash()
-        news = news_top_headlines_india(api_key=cfg.get("news_api_key", ""))
 
-        # Save CSV/JSON
+        # Save Parquet/JSON
         logging.info("Saving snapshots and analytics...")
         save_json(summary_indices, "summary_indices")
         if indian_indices:
-            save_csv(pd.DataFrame.from_dict(indian_indices, orient="index").reset_index().rename(columns={"index": "Index"}), "indian_indices")
+            save_parquet(pd.DataFrame.from_dict(indian_indices, orient="index").reset_index().rename(columns={"index": "Index"}), "indian_indices")
         if global_indices:
-            save_csv(pd.DataFrame.from_dict(global_indices, orient="index").reset_index().rename(columns={"index": "Index"}), "global_indices")
+            save_parquet(pd.DataFrame.from_dict(global_indices, orient="index").reset_index().rename(columns={"index": "Index"}), "global_indices")
         if currencies:
-            save_csv(pd.DataFrame.from_dict(currencies, orient="index").reset_index().rename(columns={"index": "Pair"}), "currencies")
+            save_parquet(pd.DataFrame.from_dict(currencies, orient="index").reset_index().rename(columns={"index": "Pair"}), "currencies")
         if commodities:
-            save_csv(pd.DataFrame.from_dict(commodities, orient="index").reset_index().rename(columns={"index": "Commodity"}), "commodities")
+            save_parquet(pd.DataFrame.from_dict(commodities, orient="index").reset_index().rename(columns={"index": "Commodity"}), "commodities")
         if crypto:
-            save_csv(pd.DataFrame.from_dict(crypto, orient="index").reset_index().rename(columns={"index": "Crypto"}), "crypto")
+            save_parquet(pd.DataFrame.from_dict(crypto, orient="index").reset_index().rename(columns={"index": "Crypto"}), "crypto")
         if not universe.empty:
-            save_csv(universe, "nifty50_universe")
+            save_parquet(universe, "nifty50_universe")
         if not gainers.empty:
-            save_csv(gainers, "top_gainers")
+            save_parquet(gainers, "top_gainers")
         if not losers.empty:
-            save_csv(losers, "top_losers")
+            save_parquet(losers, "top_losers")
         if not sector_perf.empty:
-            save_csv(sector_perf, "sector_performance")
+            save_parquet(sector_perf, "sector_performance")
         if fii:
             save_json(fii, "fii_dii")
         if news:
@@ -108,18 +161,20 @@ def build():
 
         # Charts
         logging.info("Building charts...")
-        charts = {}
+        chart_specs = []  # (title, kind, args)
         if not hist_nifty.empty:
-            charts["NIFTY 50 - Candlestick"] = candlestick_chart(hist_nifty.tail(60), "NIFTY 50", "nifty_candle.png")
-            charts["NIFTY 50 - Close"] = line_chart(hist_nifty["Close"], "NIFTY 50 Close", "nifty_line.png")
+            chart_specs.append(("NIFTY 50 - Candlestick", "candle", (hist_nifty.tail(60), "NIFTY 50", "nifty_candle.png")))
+            chart_specs.append(("NIFTY 50 - Close", "line", (hist_nifty["Close"], "NIFTY 50 Close", "nifty_line.png")))
         if not hist_bank.empty:
-            charts["BANK NIFTY - Candlestick"] = candlestick_chart(hist_bank.tail(60), "BANK NIFTY", "banknifty_candle.png")
-            charts["BANK NIFTY - Close"] = line_chart(hist_bank["Close"], "BANK NIFTY Close", "banknifty_line.png")
+            chart_specs.append(("BANK NIFTY - Candlestick", "candle", (hist_bank.tail(60), "BANK NIFTY", "banknifty_candle.png")))
+            chart_specs.append(("BANK NIFTY - Close", "line", (hist_bank["Close"], "BANK NIFTY Close", "banknifty_line.png")))
 
         if not gainers.empty:
-            charts["Top 5 Gainers"] = bar_chart(gainers, "Symbol", "Change%", "Top 5 Gainers", "gainers_bar.png")
+            chart_specs.append(("Top 5 Gainers", "bar", (gainers, "Symbol", "Change%", "Top 5 Gainers", "gainers_bar.png")))
         if not losers.empty:
-            charts["Top 5 Losers"] = bar_chart(losers, "Symbol", "Change%", "Top 5 Losers", "losers_bar.png")
+            chart_specs.append(("Top 5 Losers", "bar", (losers, "Symbol", "Change%", "Top 5 Losers", "losers_bar.png")))
+
+        charts = _render_charts(chart_specs)
 
         # TA
         logging.info("Performing Technical Analysis...")
@@ -155,15 +210,15 @@ def build():
         commodity_rows = dict_to_rows(commodities, "Commodity")
 
         gain_rows = [["Symbol", "Change %", "Close"]] + (
-            [[r["Symbol"], f"{float(r['Change%']):.2f}%", f"{float(r['Close']):.2f}"] for _, r in gainers.iterrows()]
+            [[s, f"{c:.2f}%", f"{p:.2f}"] for s, c, p in zip(gainers["Symbol"], gainers["Change%"].tolist(), gainers["Close"].tolist())]
             if not gainers.empty else [["-", "-", "-"]]
         )
         lose_rows = [["Symbol", "Change %", "Close"]] + (
-            [[r["Symbol"], f"{float(r['Change%']):.2f}%", f"{float(r['Close']):.2f}"] for _, r in losers.iterrows()]
+            [[s, f"{c:.2f}%", f"{p:.2f}"] for s, c, p in zip(losers["Symbol"], losers["Change%"].tolist(), losers["Close"].tolist())]
             if not losers.empty else [["-", "-", "-"]]
         )
         sector_rows = [["Sector", "Avg Change %"]] + (
-            [[r["Sector"], f"{float(r['Change%']):.2f}%"] for _, r in sector_perf.iterrows()]
+            [[s, f"{c:.2f}%"] for s, c in zip(sector_perf["Sector"], sector_perf["Change%"].tolist())]
             if not sector_perf.empty else [["-", "-"]]
         )
 
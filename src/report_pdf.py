@@ -8,21 +8,29 @@ from reportlab.lib.pagesizes import A4
 from .utils import OUT_DIR
 
 
+# Style objects are immutable once built; construct them once per process
+_STYLES = getSampleStyleSheet()
+_STYLES.add(ParagraphStyle(name="SectionTitle", fontSize=14, leading=16, spaceAfter=8, textColor=colors.HexColor("#222222")))
+_STYLES.add(ParagraphStyle(name="SubSection", fontSize=12, leading=14, spaceAfter=6, textColor=colors.HexColor("#444444")))
+
+_TABLE_STYLE = TableStyle([
+    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#f0f0f0")),
+    ("TEXTCOLOR", (0, 0), (-1, 0), colors.HexColor("#333333")),
+    ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+    ("ALIGN", (1, 1), (-1, -1), "RIGHT"),
+    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.whitesmoke, colors.lightgrey]),
+])
+
+
 def _make_table(data, colWidths=None):
     """Create a styled table for the PDF."""
     if not data or not isinstance(data, list) or not data[0]:
-        return Paragraph("<i>No data available</i>", getSampleStyleSheet()["BodyText"])
+        return Paragraph("<i>No data available</i>", _STYLES["BodyText"])
 
     t = Table(data, colWidths=colWidths)
-    t.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#f0f0f0")),
-        ("TEXTCOLOR", (0, 0), (-1, 0), colors.HexColor("#333333")),
-        ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
-        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-        ("ALIGN", (1, 1), (-1, -1), "RIGHT"),
-        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.whitesmoke, colors.lightgrey]),
-    ]))
+    t.setStyle(_TABLE_STYLE)
     return t
 
 
@@ -30,22 +38,18 @@ def build_pdf(ctx: dict):
     """Build the financial report PDF."""
     out_path = OUT_DIR / f"Daily_Financial_Market_Report-{datetime.now().date()}.pdf"
 
-    styles = getSampleStyleSheet()
-    styles.add(ParagraphStyle(name="SectionTitle", fontSize=14, leading=16, spaceAfter=8, textColor=colors.HexColor("#222222")))
-    styles.add(ParagraphStyle(name="SubSection", fontSize=12, leading=14, spaceAfter=6, textColor=colors.HexColor("#444444")))
-
     story = []
 
     # Title
-    story.append(Paragraph("<b>Daily Financial Market Report</b>", styles["Title"]))
+    story.append(Paragraph("<b>Daily Financial Market Report</b>", _STYLES["Title"]))
     story.append(Spacer(1, 8))
-    story.append(Paragraph(datetime.now().strftime("%A, %d %B %Y"), styles["Normal"]))
+    story.append(Paragraph(datetime.now().strftime("%A, %d %B %Y"), _STYLES["Normal"]))
     story.append(Spacer(1, 16))
 
     # Section builder
     def add_section(title, key, colWidths):
         if ctx.get(key):
-            story.append(Paragraph(f"<b>{title}</b>", styles["SectionTitle"]))
+            story.append(Paragraph(f"<b>{title}</b>", _STYLES["SectionTitle"]))
             story.append(_make_table(ctx[key], colWidths=colWidths))
             story.append(Spacer(1, 12))
 
@@ -60,31 +64,31 @@ def build_pdf(ctx: dict):
 
     # TA Sections
     if ctx.get("ta_sections"):
-        story.append(Paragraph("<b>Technical Overview</b>", styles["SectionTitle"]))
+        story.append(Paragraph("<b>Technical Overview</b>", _STYLES["SectionTitle"]))
         for name, metrics in ctx["ta_sections"]:
             rows = [["Metric", "Value"]] + [[k, v] for k, v in metrics.items()]
-            story.append(Paragraph(f"<b>{name}</b>", styles["SubSection"]))
+            story.append(Paragraph(f"<b>{name}</b>", _STYLES["SubSection"]))
             story.append(_make_table(rows, colWidths=[200, 200]))
             story.append(Spacer(1, 10))
 
     # Charts
     if ctx.get("charts"):
-        story.append(Paragraph("<b>Charts</b>", styles["SectionTitle"]))
+        story.append(Paragraph("<b>Charts</b>", _STYLES["SectionTitle"]))
         for title, path in ctx["charts"].items():
-            story.append(Paragraph(title, styles["SubSection"]))
+            story.append(Paragraph(title, _STYLES["SubSection"]))
             try:
                 story.append(Image(path, width=480, height=300))
             except Exception:
-                story.append(Paragraph("<i>[Chart unavailable]</i>", styles["BodyText"]))
+                story.append(Paragraph("<i>[Chart unavailable]</i>", _STYLES["BodyText"]))
             story.append(Spacer(1, 12))
 
     # News
     if ctx.get("news"):
-        story.append(Paragraph("<b>Top Business News (India)</b>", styles["SectionTitle"]))
+        story.append(Paragraph("<b>Top Business News (India)</b>", _STYLES["SectionTitle"]))
         for a in ctx["news"]:
             t = a.get("title", "")
             s = a.get("source", "")
-            story.append(Paragraph(f"• {t} <font size=8 color='#555555'>[{s}]</font>", styles["BodyText"]))
+            story.append(Paragraph(f"• {t} <font size=8 color='#555555'>[{s}]</font>", _STYLES["BodyText"]))
         story.append(Spacer(1, 12))
 
     # Build document
@@ -1,5 +1,34 @@
 import numpy as np
 import pandas as pd
+from numba import njit
+
+
+@njit(cache=True)
+def _ema_kernel(x, alpha):
+    out = np.empty_like(x)
+    out[0] = x[0]
+    for i in range(1, x.size):
+        out[i] = alpha * x[i] + (1.0 - alpha) * out[i - 1]
+    return out
+
+
+@njit(cache=True)
+def _macd_kernel(x, a_fast, a_slow, a_sig):
+    # Fast EMA, slow EMA and signal EMA in a single pass over x
+    n = x.size
+    macd_line = np.empty(n)
+    signal_line = np.empty(n)
+    fast = x[0]
+    slow = x[0]
+    macd_line[0] = 0.0
+    signal_line[0] = 0.0
+    for i in range(1, n):
+        fast = a_fast * x[i] + (1.0 - a_fast) * fast
+        slow = a_slow * x[i] + (1.0 - a_slow) * slow
+        m = fast - slow
+        macd_line[i] = m
+        signal_line[i] = a_sig * m + (1.0 - a_sig) * signal_line[i - 1]
+    return macd_line, signal_line, macd_line - signal_line
 
 
 def ema(series: pd.Series, span: int) -> pd.Series:
@@ -15,7 +44,11 @@ def ema(series: pd.Series, span: int) -> pd.Series:
     """
     if series is None or series.empty:
         return pd.Series(dtype=float)
-    return series.ewm(span=span, adjust=False).mean()
+    x = series.to_numpy(dtype=np.float64)
+    if np.isnan(x).any():
+        # Keep pandas' NaN weighting for gappy input
+        return series.ewm(span=span, adjust=False).mean()
+    return pd.Series(_ema_kernel(x, 2.0 / (span + 1)), index=series.index, name=series.name)
 
 
 def macd(series: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9):
@@ -35,9 +68,15 @@ def macd(series: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9):
         empty = pd.Series(dtype=float)
         return empty, empty, empty
 
-    macd_line = ema(series, fast) - ema(series, slow)
-    signal_line = ema(macd_line, signal)
-    hist = macd_line - signal_line
+    x = series.to_numpy(dtype=np.float64)
+    if np.isnan(x).any():
+        macd_line = ema(series, fast) - ema(series, slow)
+        signal_line = ema(macd_line, signal)
+        hist = macd_line - signal_line
+        return macd_line, signal_line, hist
+
+    out = _macd_kernel(x, 2.0 / (fast + 1), 2.0 / (slow + 1), 2.0 / (signal + 1))
+    macd_line, signal_line, hist = (pd.Series(a, index=series.index) for a in out)
     return macd_line, signal_line, hist
 
 
@@ -55,11 +94,11 @@ def support_resistance(series: pd.Series, window: int = 20):
     if series is None or series.empty:
         return 0.0, 0.0
 
-    w = series.tail(window).dropna()
-    if w.empty:
+    w = series.to_numpy(dtype=np.float64)[-window:]
+    if np.isnan(w).all():
         return 0.0, 0.0
 
-    return float(w.min()), float(w.max())
+    return float(np.nanmin(w)), float(np.nanmax(w))
 
 
 def trend_direction(series: pd.Series, window: int = 10, tol: float = 1e-6):
@@ -81,8 +120,10 @@ def trend_direction(series: pd.Series, window: int = 10, tol: float = 1e-6):
     if len(y) < 2:
         return "Sideways", 0.0
 
-    x = np.arange(len(y))
-    slope = float(np.polyfit(x, y, 1)[0])
+    # Least-squares slope against x = 0..n-1: sum((x - xm) * y) / sum((x - xm)^2)
+    n = len(y)
+    xc = np.arange(n) - (n - 1) / 2.0
+    slope = float((xc * y).sum() / (n * (n * n - 1) / 12.0))
 
     if slope > tol:
         return "Up", slope
@@ -2,11 +2,17 @@ import json
 from pathlib import Path
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # optional; falls back to stdlib json
+    orjson = None
+
 # Project root and directories
 ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "data"
 OUT_DIR = ROOT / "output"
 CHART_DIR = OUT_DIR / "charts"
+CACHE_DIR = ROOT / ".cache"
 
 
 def ensure_dirs():
@@ -17,23 +23,23 @@ def ensure_dirs():
         d.mkdir(parents=True, exist_ok=True)
 
 
-def save_csv(df: pd.DataFrame, name: str):
+def save_parquet(df: pd.DataFrame, name: str):
     """
-    Save a DataFrame to CSV inside data folder.
+    Save a DataFrame to Parquet (zstd compressed) inside data folder.
 
     Args:
         df: DataFrame to save.
         name: Filename without extension.
     """
     if df is None or df.empty:
-        print(f"[WARN] Tried to save empty DataFrame: {name}.csv (skipped)")
+        print(f"[WARN] Tried to save empty DataFrame: {name}.parquet (skipped)")
         return
-    p = DATA_DIR / f"{name}.csv"
+    p = DATA_DIR / f"{name}.parquet"
     try:
-        df.to_csv(p, index=False)
-        print(f"[INFO] Saved CSV -> {p}")
+        df.to_parquet(p, index=False, compression="zstd")
+        print(f"[INFO] Saved Parquet -> {p}")
     except Exception as e:
-        print(f"[ERROR] Could not save CSV {p}: {e}")
+        print(f"[ERROR] Could not save Parquet {p}: {e}")
 
 
 def save_json(obj, name: str):
@@ -46,8 +52,11 @@ def save_json(obj, name: str):
     """
     p = DATA_DIR / f"{name}.json"
     try:
-        with open(p, "w", encoding="utf-8") as f:
-            json.dump(obj, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            p.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(p, "w", encoding="utf-8") as f:
+                json.dump(obj, f, ensure_ascii=False, indent=2)
         print(f"[INFO] Saved JSON -> {p}")
     except Exception as e:
         print(f"[ERROR] Could not save JSON {p}: {e}")